@@ -1,4 +1,6 @@
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # --- Configuration ---
@@ -6,6 +8,7 @@ GEOMETRY_COMPLETED_DIR = "geometry_inputs"
 FREQUENCY_OUTPUT_DIR = "frequency_inputs"
 GEOMETRY_CHK_DIR = "geometry_chks"
 FREQUENCY_CHK_DIR = "frequency_chks"
+WRITE_WORKERS = 8  # Threads used to write input files concurrently
 
 # Gaussian frequency input header template
 FREQUENCY_HEADER = """%mem=8GB
@@ -18,6 +21,40 @@ FREQUENCY_HEADER = """%mem=8GB
 
 """
 
+# Directory names are fixed, so fill them in once and leave only {filename}
+_FREQUENCY_TEMPLATE = (
+    FREQUENCY_HEADER
+    .replace("{geometry_chks}", GEOMETRY_CHK_DIR)
+    .replace("{frequency_chks}", FREQUENCY_CHK_DIR)
+)
+
+# Flags for writing a whole input file in one go
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+
+def _write_bytes(path, data):
+    """
+    Write `data` to `path` with raw os-level calls, skipping the text-mode
+    wrapper that open() sets up for each file.
+    """
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+def _try_write(job):
+    """
+    Write one (path, data) job, returning the OSError instead of raising so
+    a failed file doesn't abort the rest of the batch.
+    """
+    path, data = job
+    try:
+        _write_bytes(path, data)
+    except OSError as e:
+        return e
+    return None
+
 def generate_frequency_files():
     """
     Iterate through geometry_inputs_completed folder, extract filenames (strip extensions),
@@ -31,52 +68,55 @@ def generate_frequency_files():
         print(f"ERROR: Directory '{GEOMETRY_COMPLETED_DIR}' not found.")
         return
     
-    # Get list of files in geometry_inputs_completed
+    # Get list of files in geometry_inputs_completed, skipping directories.
+    # scandir's cached entry type avoids an extra stat call per file.
     try:
-        files = os.listdir(GEOMETRY_COMPLETED_DIR)
+        with os.scandir(GEOMETRY_COMPLETED_DIR) as it:
+            entries = sorted(
+                (entry for entry in it if not entry.is_dir()),
+                key=lambda entry: entry.name
+            )
     except OSError as e:
         print(f"ERROR: Could not read directory '{GEOMETRY_COMPLETED_DIR}': {e}")
         return
-    
-    if not files:
+
+    if not entries:
         print(f"WARNING: No files found in '{GEOMETRY_COMPLETED_DIR}'")
         return
-    
-    generated_count = 0
-    
-    # Iterate through each file
-    for filename in sorted(files):
-        filepath = os.path.join(GEOMETRY_COMPLETED_DIR, filename)
-        
-        # Skip directories
-        if os.path.isdir(filepath):
-            continue
-        
+
+    # Build every (path, content) pair up front; this part is cheap
+    jobs = []
+    for entry in entries:
         # Strip extension to get base filename
-        base_name = os.path.splitext(filename)[0]
+        base_name = os.path.splitext(entry.name)[0]
         
         # Create the frequency input content
-        frequency_content = FREQUENCY_HEADER.format(
-            geometry_chks=GEOMETRY_CHK_DIR,
-            frequency_chks=FREQUENCY_CHK_DIR,
-            filename=base_name
-        )
+        frequency_content = _FREQUENCY_TEMPLATE.format(filename=base_name)
         
-        # Write the frequency input file
         output_filepath = os.path.join(FREQUENCY_OUTPUT_DIR, f"{base_name}_OptFreq.gjf")
-        try:
-            with open(output_filepath, "w") as f:
-                f.write(frequency_content)
-            print(f"✓ Generated: {output_filepath}")
+        jobs.append((output_filepath, frequency_content.encode()))
+
+    # Write the frequency input files concurrently (results keep input order)
+    with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as executor:
+        errors = list(executor.map(_try_write, jobs))
+
+    # Collect the per-file messages and emit them with a single write
+    messages = []
+    generated_count = 0
+    for (output_filepath, _), error in zip(jobs, errors):
+        if error is None:
+            messages.append(f"✓ Generated: {output_filepath}")
             generated_count += 1
-        except IOError as e:
-            print(f"ERROR: Could not write '{output_filepath}': {e}")
+        else:
+            messages.append(f"ERROR: Could not write '{output_filepath}': {error}")
     
     # Summary
-    print("-" * 60)
-    print(f"Successfully generated {generated_count} frequency input file(s).")
-    print(f"Files saved to: {FREQUENCY_OUTPUT_DIR}/")
-    print("-" * 60)
+    messages.append("-" * 60)
+    messages.append(f"Successfully generated {generated_count} frequency input file(s).")
+    messages.append(f"Files saved to: {FREQUENCY_OUTPUT_DIR}/")
+    messages.append("-" * 60)
+    sys.stdout.write("\n".join(messages) + "\n")
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     print("Starting frequency input file generation...")
@@ -1,5 +1,8 @@
 import itertools
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 # --- Configuration for Gaussian Header ---
 GAUSSIAN_HEADER = """%mem=2GB
@@ -12,6 +15,9 @@ GAUSSIAN_HEADER = """%mem=2GB
 {charge} {multiplicity}
 """
 
+# Threads used to write GJF files concurrently
+WRITE_WORKERS = 8
+
 # --- Base Coordinates from Hexachlorobenzene Template ---
 # The six Carbon atoms of the ring are fixed for all isomers.
 C_ATOMS = [
@@ -35,67 +41,133 @@ SUBSTITUENT_COORDS = [
     '-1.88580  -3.64003  0.00000', # Site 6
 ]
 
+# Atom lines for each site when fully chlorinated / fully hydrogenated,
+# built once so the generators only pick entries instead of formatting.
+CL_LINES = [f"Cl {coords}" for coords in SUBSTITUENT_COORDS]
+H_LINES = [f"H  {coords}" for coords in SUBSTITUENT_COORDS]
+
 # --- 12 Unique Chlorobenzene Isomers (Cl positions are 1-based indices) ---
 # This list covers x=1 to x=6 chlorines, respecting rotational symmetry.
+# Each isomer is stored once as a frozenset; use sorted() where digit order matters.
 CHLORINE_POSITIONS = [
-    (1,),                                     # Monobromo (1)
-    (1, 2), (1, 3), (1, 4),                   # Dichloro (1,2 / 1,3 / 1,4)
-    (1, 2, 3), (1, 2, 4), (1, 3, 5),          # Trichloro (1,2,3 / 1,2,4 / 1,3,5)
-    (1, 2, 3, 4), (1, 2, 3, 5), (1, 2, 4, 5), # Tetrachloro (Symmetry: same as 1,4 / 1,3 / 1,2 dichloro)
-    (1, 2, 3, 4, 5),                          # Pentachloro (Symmetry: same as 1-chloro)
-    (1, 2, 3, 4, 5, 6),                       # Hexachloro
+    frozenset({1}),                                                     # Monobromo (1)
+    frozenset({1, 2}), frozenset({1, 3}), frozenset({1, 4}),            # Dichloro (1,2 / 1,3 / 1,4)
+    frozenset({1, 2, 3}), frozenset({1, 2, 4}), frozenset({1, 3, 5}),   # Trichloro (1,2,3 / 1,2,4 / 1,3,5)
+    frozenset({1, 2, 3, 4}), frozenset({1, 2, 3, 5}), frozenset({1, 2, 4, 5}), # Tetrachloro (Symmetry: same as 1,4 / 1,3 / 1,2 dichloro)
+    frozenset({1, 2, 3, 4, 5}),                                         # Pentachloro (Symmetry: same as 1-chloro)
+    frozenset({1, 2, 3, 4, 5, 6}),                                      # Hexachloro
 ]
 
-def generate_gjf_files(position_list):
+def positions_mask(position_list):
     """
-    Generates a Gaussian GJF file for a specific chlorobenzene isomer.
+    Pack 1-based chlorine positions into a bitmask (bit p set for position p)
+    so site membership is a single integer AND.
+    """
+    mask = 0
+    for p in position_list:
+        mask |= 1 << p
+    return mask
+
+
+def substituent_lines(mask):
+    """Return the 6 substituent atom lines (Cl where the mask bit is set, H otherwise)."""
+    return [
+        CL_LINES[i] if mask & (1 << (i + 1)) else H_LINES[i]
+        for i in range(6)
+    ]
+
+
+@lru_cache(maxsize=None)
+def header_template(charge, multiplicity):
+    """
+    Return GAUSSIAN_HEADER with the charge and multiplicity filled in,
+    leaving only the {filename} and {title} fields to format per file.
+    """
+    return GAUSSIAN_HEADER.replace("{charge}", charge).replace("{multiplicity}", multiplicity)
+
+
+def build_gjf_content(filename_base, title, charge, multiplicity, atoms):
+    """Assemble a full GJF file from the header fields and atom lines."""
+    gjf_content = header_template(charge, multiplicity).format(filename=filename_base, title=title)
+    gjf_content += "\n".join(atoms)
+    gjf_content += "\n\n" # Final newlines required by GJF format
+    return gjf_content
+
+
+def gjf_output_dir():
+    """
+    Return the GJF output directory, creating it if needed. Defaults to
+    'geometry_input' and can be overridden with `GJF_OUTPUT_DIR`.
+    """
+    output_dir = os.environ.get("GJF_OUTPUT_DIR", "geometry_input")
+    os.makedirs(output_dir, exist_ok=True)
+    return output_dir
+
+
+def _write_gjf(job):
+    """Write a single (filepath, content) pair to disk."""
+    filepath, gjf_content = job
+    with open(filepath, "w") as f:
+        f.write(gjf_content)
+
+
+def write_gjf_files(jobs):
+    """
+    Write a batch of (filepath, content) pairs using a thread pool so the
+    small file writes overlap. Any write error is re-raised.
+    """
+    if not jobs:
+        return
+    # Never start more threads than there are files to write
+    with ThreadPoolExecutor(max_workers=min(WRITE_WORKERS, len(jobs))) as executor:
+        list(executor.map(_write_gjf, jobs))
+
+
+@lru_cache(maxsize=None)
+def isomer_gjf(positions):
+    """
+    Build the GJF for a chlorobenzene isomer without touching the filesystem.
 
     Args:
-        position_list (tuple): A tuple of 1-based indices where Chlorine atoms are located.
+        positions (frozenset): 1-based indices where Chlorine atoms are located.
+
+    Returns (filename_base, gjf_content); results are cached per isomer.
     """
     # Create the filename and title based on the chlorine positions (e.g., '135ClBz')
-    position_string = "".join(map(str, position_list))
+    position_string = "".join(map(str, sorted(positions)))
     filename_base = f"{position_string}ClBz"
-    title = f"{len(position_list)}-Chloro-Benzene ({position_string})"
+    title = f"{len(positions)}-Chloro-Benzene ({position_string})"
 
     # Set charge and spin multiplicity
     charge = "0"
     multiplicity = "1"
     
-    # 1. Start with the fixed Carbon atoms
-    all_atoms = list(C_ATOMS)
-    
-    # 2. Determine the atom type for each of the 6 substituent sites
-    for i in range(6):
-        # The position index is 1-based, Python index is 0-based (i)
-        is_chlorine = (i + 1) in position_list
-        
-        # Get the coordinates for this site
-        coords = SUBSTITUENT_COORDS[i]
-        
-        if is_chlorine:
-            # If the position is in the list, it's Chlorine
-            all_atoms.append(f"Cl {coords}")
-        else:
-            # If the position is NOT in the list, it's Hydrogen
-            # Note: We use the same coordinates as the Cl position, which is standard
-            # for generating an initial geometry with Gaussian's 'opt' keyword.
-            all_atoms.append(f"H  {coords}")
-
-    # 3. Assemble the file content
-    gjf_content = GAUSSIAN_HEADER.format(filename=filename_base, title=title, charge=charge, multiplicity=multiplicity)
-    gjf_content += "\n".join(all_atoms)
-    gjf_content += "\n\n" # Final newlines required by GJF format
+    mask = positions_mask(positions)
+
+    # Fixed Carbon atoms, then Cl or H on each of the 6 substituent sites.
+    # Note: H uses the same coordinates as the Cl position, which is standard
+    # for generating an initial geometry with Gaussian's 'opt' keyword.
+    all_atoms = C_ATOMS + substituent_lines(mask)
+
+    # Assemble the file content
+    return filename_base, build_gjf_content(filename_base, title, charge, multiplicity, all_atoms)
+
+
+def generate_gjf_files(position_list):
+    """
+    Generates a Gaussian GJF file for a specific chlorobenzene isomer.
+
+    Args:
+        position_list (iterable): 1-based indices where Chlorine atoms are located
+            (e.g. a frozenset from CHLORINE_POSITIONS).
+    """
+    filename_base, gjf_content = isomer_gjf(frozenset(position_list))
 
     # --- WRITE FILE TO OUTPUT DIRECTORY ---
-    # Default output directory can be overridden with the
-    # environment variable `GJF_OUTPUT_DIR` or changed here.
-    OUTPUT_DIR = os.environ.get("GJF_OUTPUT_DIR", "geometry_input")
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    OUTPUT_DIR = gjf_output_dir()
 
     filepath = os.path.join(OUTPUT_DIR, f"{filename_base}.gjf")
-    with open(filepath, "w") as f:
-        f.write(gjf_content)
+    _write_gjf((filepath, gjf_content))
 
     print(f"--- Wrote GJF file: {filepath} ---")
     # -----------------------------
@@ -103,24 +175,15 @@ def generate_gjf_files(position_list):
     return filepath, gjf_content
 
 
-def generate_anion_radicals(position_list):
+@lru_cache(maxsize=None)
+def anion_radical_gjf(positions):
     """
-    Generate a single GJF anion-radical file for the provided isomer.
-
-    This does NOT remove any atoms — it takes the original isomer geometry,
-    adds one electron (charge = -1) and sets multiplicity = 2 (doublet).
+    Build the anion-radical GJF for the isomer `positions` (a frozenset).
 
-    Filename format: '<positions>ClBzAnionRadical.gjf' (e.g. '135ClBzAnionRadical.gjf').
-
-    Returns a list with a single (filepath, content) tuple for the file written.
+    Returns (filename_base, gjf_content); results are cached per isomer.
     """
-    results = []
-
-    OUTPUT_DIR = os.environ.get("GJF_OUTPUT_DIR", "geometry_input")
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-    # Ensure input positions is a tuple/list of ints
-    original_positions = tuple(position_list)
+    original_positions = tuple(sorted(positions))
+    mask = positions_mask(original_positions)
 
     # Build file for the intact isomer but as an anion radical
     position_string = "".join(map(str, original_positions))
@@ -132,28 +195,71 @@ def generate_anion_radicals(position_list):
     multiplicity = "2"
 
     # Assemble atoms: keep all substituents (Cl where present, H otherwise)
-    all_atoms = list(C_ATOMS)
-    for i in range(6):
-        is_chlorine = (i + 1) in original_positions
-        coords = SUBSTITUENT_COORDS[i]
-        if is_chlorine:
-            all_atoms.append(f"Cl {coords}")
-        else:
-            all_atoms.append(f"H  {coords}")
-
-    gjf_content = GAUSSIAN_HEADER.format(filename=filename_base, title=title, charge=charge, multiplicity=multiplicity)
-    gjf_content += "\n".join(all_atoms)
-    gjf_content += "\n\n"
+    all_atoms = C_ATOMS + substituent_lines(mask)
+    return filename_base, build_gjf_content(filename_base, title, charge, multiplicity, all_atoms)
+
+
+def generate_anion_radicals(position_list):
+    """
+    Generate a single GJF anion-radical file for the provided isomer.
+
+    This does NOT remove any atoms — it takes the original isomer geometry,
+    adds one electron (charge = -1) and sets multiplicity = 2 (doublet).
+
+    Filename format: '<positions>ClBzAnionRadical.gjf' (e.g. '135ClBzAnionRadical.gjf').
+
+    Returns a list with a single (filepath, content) tuple for the file written.
+    """
+    results = []
+
+    OUTPUT_DIR = gjf_output_dir()
+
+    filename_base, gjf_content = anion_radical_gjf(frozenset(position_list))
 
     filepath = os.path.join(OUTPUT_DIR, f"{filename_base}.gjf")
-    with open(filepath, "w") as f:
-        f.write(gjf_content)
+    _write_gjf((filepath, gjf_content))
 
     print(f"--- Wrote Anion Radical GJF: {filepath} ---")
     results.append((filepath, gjf_content))
 
     return results
 
+@lru_cache(maxsize=None)
+def neutral_radical_gjf(positions, removed):
+    """
+    Build the neutral-radical GJF for isomer `positions` (a frozenset) with
+    the chlorine at `removed` taken off.
+
+    Returns (filename_base, gjf_content); results are cached per
+    (isomer, removed) pair.
+    """
+    mask = positions_mask(positions)
+
+    # Build the compact pattern showing retained digits and underscore
+    pattern_parts = []
+    original_parts = []
+    for i in range(1, 7):
+        if mask & (1 << i):
+            original_parts.append(str(i))
+            if i == removed:
+                pattern_parts.append("_")
+            else:
+                pattern_parts.append(str(i))
+    pattern = "".join(pattern_parts)
+    parent = "".join(original_parts)
+    filename_base = f"{parent}-{pattern}-ClBzNeutralRadical"
+    title = f"Neutral Radical (removed {removed}) {pattern}"
+
+    # Neutral radical electronic state
+    charge = "0"
+    multiplicity = "2"
+
+    # Assemble atoms: the removed chlorine's site gets no atom
+    substituents = substituent_lines(mask)
+    all_atoms = C_ATOMS + substituents[:removed - 1] + substituents[removed:]
+    return filename_base, build_gjf_content(filename_base, title, charge, multiplicity, all_atoms)
+
+
 def generate_neutral_radicals_intermediates(position_list):
     """
     Generate GJF files for every way of removing one chlorine from the
@@ -168,59 +274,19 @@ def generate_neutral_radicals_intermediates(position_list):
     """
     results = []
 
-    OUTPUT_DIR = os.environ.get("GJF_OUTPUT_DIR", "geometry_input")
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-    # Ensure input positions is a tuple/list of ints
-    original_positions = tuple(position_list)
-
-    for removed in original_positions:
-        # Build the compact pattern showing retained digits and underscore
-        pattern_parts = []
-        original_parts = []
-        for i in range(1, 7):
-            if i in original_positions:
-                original_parts.append(str(i))
-                if i == removed:
-                    pattern_parts.append("_")
-                else:
-                    pattern_parts.append(str(i))
-        pattern = "".join(pattern_parts)
-        parent = "".join(original_parts)
-        filename_base = f"{parent}-{pattern}-ClBzNeutralRadical"
-        title = f"Neutral Radical (removed {removed}) {pattern}"
-
-        # New positions: remove the selected chlorine
-        new_positions = tuple(p for p in original_positions if p != removed)
-
-        # Neutral radical electronic state
-        charge = "0"
-        multiplicity = "2"
-
-        # Assemble atoms
-        all_atoms = list(C_ATOMS)
-        for i in range(6):
-            is_chlorine = (i + 1) in new_positions
-            coords = SUBSTITUENT_COORDS[i]
-            if is_chlorine:
-                all_atoms.append(f"Cl {coords}")
-            elif i == removed - 1:
-                # The coodinate is skipped (no atom) for the removed chlorine
-                continue
-            else:
-                all_atoms.append(f"H  {coords}")
+    OUTPUT_DIR = gjf_output_dir()
 
-        gjf_content = GAUSSIAN_HEADER.format(filename=filename_base, title=title, charge=charge, multiplicity=multiplicity)
-        gjf_content += "\n".join(all_atoms)
-        gjf_content += "\n\n"
+    positions = frozenset(position_list)
 
+    for removed in sorted(positions):
+        filename_base, gjf_content = neutral_radical_gjf(positions, removed)
         filepath = os.path.join(OUTPUT_DIR, f"{filename_base}.gjf")
-        with open(filepath, "w") as f:
-            f.write(gjf_content)
-
-        print(f"--- Wrote Neutral Radical GJF: {filepath} ---")
         results.append((filepath, gjf_content))
 
+    # Write all intermediates for this isomer at once
+    write_gjf_files(results)
+    sys.stdout.write("".join(f"--- Wrote Neutral Radical GJF: {path} ---\n" for path, _ in results))
+
     return filepath
 
 if __name__ == "__main__":
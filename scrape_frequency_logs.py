@@ -14,34 +14,87 @@ Assumptions:
   "Alpha virt. eigenvalues --" and take the first numeric value that follows
   on that line.
 """
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+import mmap
+import os
 import re
 import csv
 import argparse
 import sys
 
 
-DG_RE = re.compile(r"Sum of electronic and thermal Free Energies=\s*([+-]?\d+(?:\.\d*)?(?:[Ee][+-]?\d+)?)")
-ALPHA_LINE_RE = re.compile(r"Alpha virt\. eigenvalues --(.*)")
-NUMBER_RE = re.compile(r"[+-]?\d+(?:\.\d*)?(?:[Ee][+-]?\d+)?")
+NUMBER = rb"[+-]?\d+(?:\.\d*)?(?:[Ee][+-]?\d+)?"
+DG_ANCHOR = b"Sum of electronic and thermal Free Energies="
+ALPHA_ANCHOR = b"Alpha virt. eigenvalues --"
+DG_RE = re.compile(re.escape(DG_ANCHOR) + rb"\s*(" + NUMBER + rb")")
+ALPHA_LINE_RE = re.compile(re.escape(ALPHA_ANCHOR) + rb"([^\n]*)")
+NUMBER_RE = re.compile(NUMBER)
 
 
-def extract_values(text: str):
-    """Return (dG, lumo) strings or None if not found."""
-    dgs = DG_RE.findall(text)
-    dG = dgs[-1] if dgs else None
+def last_match(pattern, anchor, text):
+    """Return the last match of `pattern` in `text`, or None.
+
+    Both values we want sit near the end of a Gaussian log, so instead of
+    matching every occurrence we rfind() the literal `anchor` backwards and
+    try `pattern` only at those offsets.
+    """
+    end = len(text)
+    while True:
+        pos = text.rfind(anchor, 0, end)
+        if pos < 0:
+            return None
+        m = pattern.match(text, pos)
+        if m:
+            return m
+        end = pos + len(anchor) - 1
+
+
+def first_number(line):
+    """Return the first numeric token in `line` (bytes) or None.
+
+    The value normally is the first whitespace-separated token, so try an
+    anchored match on that short token before searching the whole line.
+    """
+    tokens = line.split(None, 1)
+    if not tokens:
+        return None
+    num_match = NUMBER_RE.match(tokens[0]) or NUMBER_RE.search(line)
+    return num_match.group(0) if num_match else None
+
+
+def extract_values(text):
+    """Return (dG, lumo) strings or None if not found.
+
+    `text` is the raw log contents as a bytes-like object (bytes or mmap).
+    """
+    dG = None
+    dg_match = last_match(DG_RE, DG_ANCHOR, text)
+    if dg_match:
+        dG = dg_match.group(1).decode("ascii")
 
     lumo = None
-    alpha_matches = list(ALPHA_LINE_RE.finditer(text))
-    if alpha_matches:
-        last = alpha_matches[-1].group(1)
-        num_match = NUMBER_RE.search(last)
-        if num_match:
-            lumo = num_match.group(0)
+    alpha_match = last_match(ALPHA_LINE_RE, ALPHA_ANCHOR, text)
+    if alpha_match:
+        number = first_number(alpha_match.group(1))
+        if number is not None:
+            lumo = number.decode("ascii")
 
     return dG, lumo
 
 
+def scrape_log(path):
+    """Memory-map the log at `path` and return extract_values() for it."""
+    with open(path, "rb") as fh:
+        # mmap can't map an empty file
+        if os.fstat(fh.fileno()).st_size == 0:
+            return None, None
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return extract_values(mm)
+
+
+@lru_cache(maxsize=4096)
 def derive_name_from_stem(stem: str) -> str:
     # take up to last underscore
     if "_" in stem:
@@ -54,42 +107,62 @@ def derive_name_from_stem(stem: str) -> str:
     return left
 
 
+def _scrape_one(path):
+    """Scrape one log (given as a path string) in a worker process.
+
+    Returns (row, error): the CSV row for `path`, or None and the exception
+    if the file couldn't be read.
+    """
+    try:
+        dG, lumo = scrape_log(path)
+    except Exception as e:
+        return None, e
+
+    stem = os.path.splitext(os.path.basename(path))[0]
+    name = derive_name_from_stem(stem)
+
+    return (name, dG if dG is not None else "", lumo if lumo is not None else ""), None
+
+
 def main():
     p = argparse.ArgumentParser(description="Scrape dG and LUMO from frequency logs")
     p.add_argument("--input-dir", "-i", default="frequency_logs", help="Directory with log files")
     p.add_argument("--output", "-o", default="frequency_logs/summary.csv", help="CSV output file")
     p.add_argument("--ext", default=".log", help="File extension to include (default .log)")
+    p.add_argument("--jobs", "-j", type=int, default=None, help="Worker processes (default: CPU count)")
     args = p.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        p.error("--jobs must be >= 1")
 
     in_dir = Path(args.input_dir)
     if not in_dir.exists() or not in_dir.is_dir():
         print(f"Input dir '{in_dir}' not found", file=sys.stderr)
         sys.exit(2)
 
-    files = sorted(in_dir.glob(f"*{args.ext}"))
+    # scandir entries carry their file type, so filtering costs no extra stat;
+    # only the path strings are sent to the workers.
+    with os.scandir(in_dir) as it:
+        entries = [e for e in it if e.name.endswith(args.ext) and e.is_file()]
+    entries.sort(key=lambda e: e.name)
+    files = [e.path for e in entries]
     rows = []
 
-    for f in files:
-        try:
-            text = f.read_text(errors="ignore")
-        except Exception as e:
-            print(f"Warning: couldn't read {f}: {e}", file=sys.stderr)
-            continue
-
-        dG, lumo = extract_values(text)
+    # Each log is independent, so scrape them across processes
+    with ProcessPoolExecutor(max_workers=args.jobs) as ex:
+        results = list(ex.map(_scrape_one, files, chunksize=8))
 
-        stem = f.stem
-        name = derive_name_from_stem(stem)
-
-        rows.append((name, dG if dG is not None else "", lumo if lumo is not None else ""))
+    for f, (row, error) in zip(files, results):
+        if error is not None:
+            print(f"Warning: couldn't read {f}: {error}", file=sys.stderr)
+            continue
+        rows.append(row)
 
     out_path = Path(args.output)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_path.open("w", newline="") as csvf:
+    with out_path.open("w", newline="", buffering=1 << 20) as csvf:
         writer = csv.writer(csvf)
         writer.writerow(["Name", "dG", "LUMO"])
-        for r in rows:
-            writer.writerow(r)
+        writer.writerows(rows)
 
     print(f"Wrote {len(rows)} rows to {out_path}")
 